@@ -4,6 +4,7 @@ import os
 from fastapi import FastAPI
 
 from services.database import create_db_and_tables
+from services.http_client import HTTP_CLIENT_SERVICE
 from utils.get_env import get_app_data_directory_env
 from utils.model_availability import (
     check_llm_and_image_provider_api_or_model_availability,
@@ -21,3 +22,4 @@ async def app_lifespan(_: FastAPI):
     await create_db_and_tables()
     await check_llm_and_image_provider_api_or_model_availability()
     yield
+    await HTTP_CLIENT_SERVICE.close()
@@ -1,6 +1,5 @@
 from datetime import datetime
 from fastapi import HTTPException
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.ollama_model_status import OllamaModelStatus
@@ -57,20 +56,25 @@ async def pull_ollama_model_background_task(model: str):
 async def upsert_ollama_pull_status(
     session: AsyncSession, model: str, model_status: OllamaModelStatus
 ):
-    stmt = select(OllamaPullStatus).where(OllamaPullStatus.id == model)
-    result = await session.execute(stmt)
-    existing_record = result.scalar_one_or_none()
+    status_payload = model_status.model_dump(mode="json")
+
+    # session.get serves repeat lookups from the identity map, so only the
+    # first update during a pull touches the database for the row
+    existing_record = await session.get(OllamaPullStatus, model)
 
     if existing_record:
-        existing_record.status = model_status.model_dump(mode="json")
+        # Pull events often repeat the same status; skip dirtying the row
+        # (and the commit) when nothing changed
+        if existing_record.status == status_payload:
+            return
+        existing_record.status = status_payload
         existing_record.last_updated = datetime.now()
     else:
         new_record = OllamaPullStatus(
             id=model,
-            status=model_status.model_dump(mode="json"),
+            status=status_payload,
             last_updated=datetime.now(),
         )
         session.add(new_record)
 
     await session.commit()
-    await session.flush()
@@ -10,7 +10,7 @@ from services.image_generation_service import ImageGenerationService
 from utils.asset_directory_utils import get_images_directory
 import os
 import uuid
-from utils.file_utils import get_file_name_with_random_uuid
+from utils.file_utils import get_file_name_with_random_uuid, save_upload_file
 
 IMAGES_ROUTER = APIRouter(prefix="/images", tags=["Images"])
 
@@ -58,8 +58,7 @@ async def upload_image(
             get_images_directory(), os.path.basename(new_filename)
         )
 
-        with open(image_path, "wb") as f:
-            f.write(await file.read())
+        await save_upload_file(file, image_path)
 
         image_asset = ImageAsset(path=image_path, is_uploaded=True)
 
@@ -1,24 +1,47 @@
+import time
 from fastapi import APIRouter, HTTPException
 import aiohttp
-from typing import List, Any
+import orjson
+from typing import List, Any, Optional, Tuple
 from utils.get_layout_by_name import get_layout_by_name
 from models.presentation_layout import PresentationLayoutModel
 
 LAYOUTS_ROUTER = APIRouter(prefix="/layouts", tags=["Layouts"])
 
+# Layouts only change when the Next.js service is redeployed, so cache the
+# proxied response in-process for a short while instead of round-tripping
+# on every request. Once the TTL lapses the upstream is revalidated with
+# If-None-Match, so an unchanged payload costs a 304 instead of a re-download.
+LAYOUTS_CACHE_TTL = 60
+_layouts_cache: Optional[Tuple[float, Optional[str], Any]] = None
+
 @LAYOUTS_ROUTER.get("/", summary="Get available layouts")
 async def get_layouts():
+    global _layouts_cache
+
+    if _layouts_cache and (time.monotonic() - _layouts_cache[0]) < LAYOUTS_CACHE_TTL:
+        return _layouts_cache[2]
+
+    headers = {}
+    if _layouts_cache and _layouts_cache[1]:
+        headers["If-None-Match"] = _layouts_cache[1]
+
     url = "http://localhost:3000/api/layouts"  # Adjust port if needed
     async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and _layouts_cache:
+                _layouts_cache = (time.monotonic(), *_layouts_cache[1:])
+                return _layouts_cache[2]
             if response.status != 200:
                 error_text = await response.text()
                 raise HTTPException(
                     status_code=response.status,
                     detail=f"Failed to fetch layouts: {error_text}"
                 )
-            layouts_json = await response.json()
+            etag = response.headers.get("ETag")
+            layouts_json = await response.json(loads=orjson.loads)
     # Optionally, parse into a Pydantic model if you have one matching the structure
+    _layouts_cache = (time.monotonic(), etag, layouts_json)
     return layouts_json
 
 
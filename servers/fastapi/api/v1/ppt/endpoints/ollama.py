@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 import json
 from typing import List
@@ -38,25 +39,32 @@ async def pull_model(
             detail=f"Model {model} is not supported",
         )
 
-    try:
-        pulled_models = await list_pulled_ollama_models()
-        filtered_models = [
-            pulled_model for pulled_model in pulled_models if pulled_model.name == model
-        ]
-        if filtered_models:
-            return filtered_models[0]
-    except HTTPException as e:
-        raise e
-    except Exception as e:
+    # Listing pulled models and reading the saved pull status are
+    # independent, so overlap the Ollama roundtrip with the DB lookup
+    pulled_models, saved_pull_status = await asyncio.gather(
+        list_pulled_ollama_models(),
+        session.get(OllamaPullStatus, model),
+        return_exceptions=True,
+    )
+
+    if isinstance(pulled_models, HTTPException):
+        raise pulled_models
+    if isinstance(pulled_models, Exception):
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to check pulled models: {e}",
+            detail=f"Failed to check pulled models: {pulled_models}",
         )
 
-    saved_pull_status = None
+    filtered_models = [
+        pulled_model for pulled_model in pulled_models if pulled_model.name == model
+    ]
+    if filtered_models:
+        return filtered_models[0]
+
     saved_model_status = None
+    if isinstance(saved_pull_status, Exception):
+        saved_pull_status = None
     try:
-        saved_pull_status = await session.get(OllamaPullStatus, model)
         saved_model_status = saved_pull_status.status
     except Exception as e:
         pass
@@ -84,8 +84,10 @@ async def stream_outlines(
             presentation_outlines_text += chunk
 
         try:
+            # dirtyjson parses in pure Python; keep large outline payloads
+            # off the event loop
             presentation_outlines_json = dict(
-                dirtyjson.loads(presentation_outlines_text)
+                await asyncio.to_thread(dirtyjson.loads, presentation_outlines_text)
             )
         except Exception as e:
             traceback.print_exc()
@@ -103,7 +105,6 @@ async def stream_outlines(
         presentation.outlines = presentation_outlines.model_dump()
         presentation.title = get_presentation_title_from_outlines(presentation_outlines)
 
-        sql_session.add(presentation)
         await sql_session.commit()
 
         yield SSECompleteResponse(
@@ -1,3 +1,4 @@
+import functools
 import os
 import shutil
 import zipfile
@@ -14,7 +15,6 @@ import re
 
 from services.documents_loader import DocumentsLoader
 from utils.asset_directory_utils import get_images_directory
-import uuid
 from constants.documents import POWERPOINT_TYPES
 
 
@@ -96,15 +96,29 @@ _STYLE_TOKENS = {
 # Modifiers commonly used with style tokens
 _STYLE_MODIFIERS = {"semi", "demi", "extra", "ultra"}
 
+# Compiled once; these run for every font in every processed deck
+_CAMEL_CASE_BOUNDARY_REGEX = re.compile(r"(?<=[a-z0-9])([A-Z])")
+_UPPER_RUN_BOUNDARY_REGEX = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_WHITESPACE_REGEX = re.compile(r"\s+")
+_TYPEFACE_ATTR_REGEX = re.compile(r'typeface="([^"]+)"')
+
+# Constant command-line fragments for the conversion helpers
+_LIBREOFFICE_PDF_ARGS = ("libreoffice", "--headless", "--convert-to", "pdf", "--outdir")
+_FC_CACHE_ARGS = ("fc-cache", "-f", "-v")
+
 
 def _insert_spaces_in_camel_case(value: str) -> str:
     # Insert space before capital letters preceded by lowercase or digits (e.g., MontserratBold -> Montserrat Bold)
-    value = re.sub(r"(?<=[a-z0-9])([A-Z])", r" \1", value)
+    value = _CAMEL_CASE_BOUNDARY_REGEX.sub(r" \1", value)
     # Handle sequences like BoldItalic -> Bold Italic
-    value = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", value)
+    value = _UPPER_RUN_BOUNDARY_REGEX.sub(r"\1 \2", value)
     return value
 
 
+# Decks repeat the same handful of typefaces across every slide, so
+# memoize the pure string normalization instead of re-running the regex
+# and token passes per occurrence
+@functools.lru_cache(maxsize=1024)
 def normalize_font_family_name(raw_name: str) -> str:
     if not raw_name:
         return raw_name
@@ -113,7 +127,7 @@ def normalize_font_family_name(raw_name: str) -> str:
     # Insert spaces in camel case
     name = _insert_spaces_in_camel_case(name)
     # Collapse multiple spaces
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _WHITESPACE_REGEX.sub(" ", name).strip()
     # Lowercase helper for matching but keep original casing for output
     lower_name = name.lower()
     # Quick cut: if the full string ends with a pure style suffix, trim it
@@ -140,7 +154,7 @@ def normalize_font_family_name(raw_name: str) -> str:
         tokens_filtered = tokens_original
     normalized = " ".join(tokens_filtered).strip()
     # Final cleanup of leftover multiple spaces
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_REGEX.sub(" ", normalized)
     return normalized
 
 
@@ -200,8 +214,7 @@ def extract_fonts_from_oxml(xml_content: str) -> List[str]:
                 fonts.add(font_elem.attrib["typeface"])
 
         # Regex fallback for fonts that might be missed
-        font_pattern = r'typeface="([^"]+)"'
-        regex_fonts = re.findall(font_pattern, xml_content)
+        regex_fonts = _TYPEFACE_ATTR_REGEX.findall(xml_content)
         fonts.update(regex_fonts)
 
         # Filter out system fonts and empty values
@@ -240,6 +253,47 @@ async def check_google_font_availability(font_name: str) -> bool:
         return False
 
 
+async def check_google_fonts_availability(font_names: List[str]) -> List[bool]:
+    """
+    Check Google Fonts availability for multiple fonts in one request.
+
+    Google Fonts accepts repeated family params, so all fonts are probed
+    with a single HEAD request; a 200 means every family exists. If the
+    batched request fails (any unknown family returns 400), fall back to
+    per-font checks to find out which ones are available.
+
+    Args:
+        font_names: Names of the fonts to check
+
+    Returns:
+        List of availability flags in the same order as font_names
+    """
+    if not font_names:
+        return []
+
+    try:
+        family_params = "&".join(
+            f"family={font_name.replace(' ', '+')}" for font_name in font_names
+        )
+        url = f"https://fonts.googleapis.com/css2?{family_params}&display=swap"
+
+        async with aiohttp.ClientSession() as session:
+            async with session.head(
+                url, timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    return [True] * len(font_names)
+
+    except Exception as e:
+        print(f"Error checking Google Fonts availability in batch: {e}")
+
+    return list(
+        await asyncio.gather(
+            *[check_google_font_availability(font_name) for font_name in font_names]
+        )
+    )
+
+
 async def analyze_fonts_in_all_slides(slide_xmls: List[str]) -> FontAnalysisResult:
     """
     Analyze fonts across all slides and determine Google Fonts availability.
@@ -264,9 +318,9 @@ async def analyze_fonts_in_all_slides(slide_xmls: List[str]) -> FontAnalysisResu
     if not normalized_fonts:
         return FontAnalysisResult(internally_supported_fonts=[], not_supported_fonts=[])
 
-    # Check each normalized font's availability in Google Fonts concurrently
-    tasks = [check_google_font_availability(font) for font in normalized_fonts]
-    results = await asyncio.gather(*tasks)
+    # Check all normalized fonts' availability in Google Fonts at once
+    normalized_fonts = list(normalized_fonts)
+    results = await check_google_fonts_availability(normalized_fonts)
 
     internally_supported_fonts = []
     not_supported_fonts = []
@@ -500,9 +554,11 @@ async def _install_fonts(fonts: List[UploadFile], temp_dir: str) -> None:
         except subprocess.CalledProcessError as e:
             print(f"Warning: Failed to install font {font_file.filename}: {e}")
 
-    # Refresh font cache
+    # Refresh font cache without blocking the event loop
     try:
-        subprocess.run(["fc-cache", "-f", "-v"], check=True, capture_output=True)
+        await asyncio.to_thread(
+            subprocess.run, _FC_CACHE_ARGS, check=True, capture_output=True
+        )
     except subprocess.CalledProcessError as e:
         print(f"Warning: Failed to refresh font cache: {e}")
 
@@ -570,16 +626,10 @@ async def _convert_pptx_to_pdf(pptx_path: str, temp_dir: str) -> str:
         pdf_path = os.path.join(screenshots_dir, pdf_filename)
 
         try:
-            result = subprocess.run(
-                [
-                    "libreoffice",
-                    "--headless",
-                    "--convert-to",
-                    "pdf",
-                    "--outdir",
-                    screenshots_dir,
-                    pptx_path,
-                ],
+            # The conversion can run for minutes; keep it off the event loop
+            result = await asyncio.to_thread(
+                subprocess.run,
+                [*_LIBREOFFICE_PDF_ARGS, screenshots_dir, pptx_path],
                 check=True,
                 capture_output=True,
                 text=True,
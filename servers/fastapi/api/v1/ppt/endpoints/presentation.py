@@ -42,7 +42,7 @@ from utils.llm_calls.generate_presentation_outlines import generate_ppt_outline
 from models.sql.slide import SlideModel
 from models.sse_response import SSECompleteResponse, SSEErrorResponse, SSEResponse
 
-from services.database import get_async_session
+from services.database import async_session_maker, get_async_session
 from services.temp_file_service import TEMP_FILE_SERVICE
 from services.concurrent_service import CONCURRENT_SERVICE
 from models.sql.presentation import PresentationModel
@@ -70,9 +70,24 @@ import uuid
 
 PRESENTATION_ROUTER = APIRouter(prefix="/presentation", tags=["Presentation"])
 
+# The frames that open and close the streamed slides array never change,
+# so serialize them once at import
+SLIDES_STREAM_OPEN_FRAME = SSEResponse(
+    event="response",
+    data=json.dumps({"type": "chunk", "chunk": '{ "slides": [ '}),
+).to_string()
+SLIDES_STREAM_CLOSE_FRAME = SSEResponse(
+    event="response",
+    data=json.dumps({"type": "chunk", "chunk": " ] }"}),
+).to_string()
+
 
 @PRESENTATION_ROUTER.get("/all", response_model=List[PresentationWithSlides])
-async def get_all_presentations(sql_session: AsyncSession = Depends(get_async_session)):
+async def get_all_presentations(
+    limit: Optional[int] = None,
+    created_before: Optional[datetime] = None,
+    sql_session: AsyncSession = Depends(get_async_session),
+):
     presentations_with_slides = []
 
     query = (
@@ -83,6 +98,12 @@ async def get_all_presentations(sql_session: AsyncSession = Depends(get_async_se
         )
         .order_by(PresentationModel.created_at.desc())
     )
+    # Keyset pagination: pass the created_at of the last row from the
+    # previous page to fetch the next one
+    if created_before is not None:
+        query = query.where(PresentationModel.created_at < created_before)
+    if limit is not None:
+        query = query.limit(limit)
 
     results = await sql_session.execute(query)
     rows = results.all()
@@ -118,13 +139,14 @@ async def get_presentation(
 async def delete_presentation(
     id: uuid.UUID, sql_session: AsyncSession = Depends(get_async_session)
 ):
-    presentation = await sql_session.get(PresentationModel, id)
-    if not presentation:
-        raise HTTPException(404, "Presentation not found")
-
-    await sql_session.delete(presentation)
+    result = await sql_session.execute(
+        delete(PresentationModel).where(PresentationModel.id == id)
+    )
     await sql_session.commit()
 
+    if result.rowcount == 0:
+        raise HTTPException(404, "Presentation not found")
+
 
 @PRESENTATION_ROUTER.post("/create", response_model=PresentationModel)
 async def create_presentation(
@@ -223,7 +245,7 @@ async def prepare_presentation(
                     i + 1 if presentation.include_title_slide else i,
                     toc_slide_layout_index,
                 )
-                toc_outline = "Table of Contents\n\n"
+                toc_outline_parts = ["Table of Contents\n\n"]
 
                 for outline in presentation_outline_model.slides[
                     outline_index:outlines_to
@@ -233,7 +255,9 @@ async def prepare_presentation(
                         if presentation.include_title_slide
                         else outline_index - i + n_toc_slides
                     )
-                    toc_outline += f"Slide page number: {page_number}\n Slide Content: {outline.content[:100]}\n\n"
+                    toc_outline_parts.append(
+                        f"Slide page number: {page_number}\n Slide Content: {outline.content[:100]}\n\n"
+                    )
                     outline_index += 1
 
                 outline_index += 1
@@ -241,11 +265,10 @@ async def prepare_presentation(
                 presentation_outline_model.slides.insert(
                     i + 1 if presentation.include_title_slide else i,
                     SlideOutlineModel(
-                        content=toc_outline,
+                        content="".join(toc_outline_parts),
                     ),
                 )
 
-    sql_session.add(presentation)
     presentation.outlines = presentation_outline_model.model_dump(mode="json")
     presentation.title = title or presentation.title
     presentation.set_layout(layout)
@@ -284,10 +307,7 @@ async def stream_presentation(
         async_assets_generation_tasks = []
 
         slides: List[SlideModel] = []
-        yield SSEResponse(
-            event="response",
-            data=json.dumps({"type": "chunk", "chunk": '{ "slides": [ '}),
-        ).to_string()
+        yield SLIDES_STREAM_OPEN_FRAME
         for i, slide_layout_index in enumerate(structure.slides):
             slide_layout = layout.slides[slide_layout_index]
 
@@ -327,10 +347,7 @@ async def stream_presentation(
                 data=json.dumps({"type": "chunk", "chunk": slide.model_dump_json()}),
             ).to_string()
 
-        yield SSEResponse(
-            event="response",
-            data=json.dumps({"type": "chunk", "chunk": " ] }"}),
-        ).to_string()
+        yield SLIDES_STREAM_CLOSE_FRAME
 
         generated_assets_lists = await asyncio.gather(*async_assets_generation_tasks)
         generated_assets = []
@@ -341,9 +358,7 @@ async def stream_presentation(
         await sql_session.execute(
             delete(SlideModel).where(SlideModel.presentation == id)
         )
-        await sql_session.commit()
 
-        sql_session.add(presentation)
         sql_session.add_all(slides)
         sql_session.add_all(generated_assets)
         await sql_session.commit()
@@ -383,10 +398,16 @@ async def update_presentation(
         presentation.sqlmodel_update(presentation_update_dict)
 
     if slides:
-        # Just to make sure id is UUID
-        for slide in slides:
-            slide.presentation = uuid.UUID(slide.presentation)
-            slide.id = uuid.UUID(slide.id)
+        # SQLModel table models skip validation on init, so coerce and
+        # validate the incoming IDs before touching the database
+        try:
+            for slide in slides:
+                if isinstance(slide.presentation, str):
+                    slide.presentation = uuid.UUID(slide.presentation)
+                if isinstance(slide.id, str):
+                    slide.id = uuid.UUID(slide.id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid slide ID")
 
         await sql_session.execute(
             delete(SlideModel).where(SlideModel.presentation == presentation.id)
@@ -414,7 +435,8 @@ async def export_presentation_as_pptx(
     pptx_path = os.path.join(
         export_directory, f"{pptx_model.name or uuid.uuid4()}.pptx"
     )
-    pptx_creator.save(pptx_path)
+    # Saving the pptx is blocking disk work; keep it off the event loop
+    await asyncio.to_thread(pptx_creator.save, pptx_path)
 
     return pptx_path
 
@@ -475,8 +497,14 @@ async def check_if_api_request_is_valid(
             )
         template_id = request.template.replace("custom-", "")
         try:
-            template = await sql_session.get(TemplateModel, uuid.UUID(template_id))
-            if not template:
+            # Only the id is needed for the existence check; skip
+            # hydrating the full template row
+            template_exists = await sql_session.scalar(
+                select(TemplateModel.id).where(
+                    TemplateModel.id == uuid.UUID(template_id)
+                )
+            )
+            if not template_exists:
                 raise Exception()
         except Exception:
             raise HTTPException(
@@ -496,6 +524,10 @@ async def generate_presentation_handler(
     try:
         using_slides_markdown = False
 
+        # The template layout doesn't depend on the outlines, so fetch it
+        # concurrently with outline generation
+        layout_model_task = asyncio.create_task(get_layout_by_name(request.template))
+
         if request.slides_markdown:
             using_slides_markdown = True
             request.n_slides = len(request.slides_markdown)
@@ -507,7 +539,6 @@ async def generate_presentation_handler(
             if async_status:
                 async_status.message = "Generating presentation outlines"
                 async_status.updated_at = datetime.now()
-                sql_session.add(async_status)
                 await sql_session.commit()
 
             if request.files:
@@ -551,8 +582,12 @@ async def generate_presentation_handler(
                 presentation_outlines_text += chunk
 
             try:
+                # dirtyjson parses in pure Python; keep large outline
+                # payloads off the event loop
                 presentation_outlines_json = dict(
-                    dirtyjson.loads(presentation_outlines_text)
+                    await asyncio.to_thread(
+                        dirtyjson.loads, presentation_outlines_text
+                    )
                 )
             except Exception:
                 traceback.print_exc()
@@ -579,14 +614,13 @@ async def generate_presentation_handler(
         if async_status:
             async_status.message = "Selecting layout for each slide"
             async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
             await sql_session.commit()
 
         print("-" * 40)
         print(f"Generated {total_outlines} outlines for the presentation")
 
         # Parse Layouts
-        layout_model = await get_layout_by_name(request.template)
+        layout_model = await layout_model_task
         total_slide_layouts = len(layout_model.slides)
 
         # Generate Structure
@@ -626,7 +660,7 @@ async def generate_presentation_handler(
                         i + 1 if request.include_title_slide else i,
                         toc_slide_layout_index,
                     )
-                    toc_outline = "Table of Contents\n\n"
+                    toc_outline_parts = ["Table of Contents\n\n"]
 
                     for outline in presentation_outlines.slides[
                         outline_index:outlines_to
@@ -636,7 +670,9 @@ async def generate_presentation_handler(
                             if request.include_title_slide
                             else outline_index - i + n_toc_slides
                         )
-                        toc_outline += f"Slide page number: {page_number}\n Slide Content: {outline.content[:100]}\n\n"
+                        toc_outline_parts.append(
+                            f"Slide page number: {page_number}\n Slide Content: {outline.content[:100]}\n\n"
+                        )
                         outline_index += 1
 
                     outline_index += 1
@@ -644,7 +680,7 @@ async def generate_presentation_handler(
                     presentation_outlines.slides.insert(
                         i + 1 if request.include_title_slide else i,
                         SlideOutlineModel(
-                            content=toc_outline,
+                            content="".join(toc_outline_parts),
                         ),
                     )
 
@@ -667,7 +703,6 @@ async def generate_presentation_handler(
         if async_status:
             async_status.message = "Generating slides"
             async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
             await sql_session.commit()
 
         image_generation_service = ImageGenerationService(get_images_directory())
@@ -726,7 +761,6 @@ async def generate_presentation_handler(
         if async_status:
             async_status.message = "Fetching assets for slides"
             async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
             await sql_session.commit()
 
         # Run all asset tasks concurrently while batches may still be generating content
@@ -744,7 +778,6 @@ async def generate_presentation_handler(
         if async_status:
             async_status.message = "Exporting presentation"
             async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
 
         # 9. Export
         presentation_and_path = await export_presentation(
@@ -761,7 +794,6 @@ async def generate_presentation_handler(
             async_status.status = "completed"
             async_status.data = response.model_dump(mode="json")
             async_status.updated_at = datetime.now()
-            sql_session.add(async_status)
             await sql_session.commit()
 
         # Triggering webhook on success
@@ -794,13 +826,28 @@ async def generate_presentation_handler(
             async_status.message = "Presentation generation failed"
             async_status.updated_at = datetime.now()
             async_status.error = api_error_model.model_dump(mode="json")
-            sql_session.add(async_status)
             await sql_session.commit()
 
         else:
             raise e
 
 
+async def generate_presentation_background_task(
+    request: GeneratePresentationRequest,
+    presentation_id: uuid.UUID,
+    async_status_id: str,
+):
+    # The request-scoped session is released once the response is sent,
+    # so the background task runs the generation on its own session
+    async with async_session_maker() as sql_session:
+        async_status = await sql_session.get(
+            AsyncPresentationGenerationTaskModel, async_status_id
+        )
+        await generate_presentation_handler(
+            request, presentation_id, async_status, sql_session
+        )
+
+
 @PRESENTATION_ROUTER.post("/generate", response_model=PresentationPathAndEditPath)
 async def generate_presentation_sync(
     request: GeneratePresentationRequest,
@@ -836,11 +883,10 @@ async def generate_presentation_async(
         await sql_session.commit()
 
         background_tasks.add_task(
-            generate_presentation_handler,
+            generate_presentation_background_task,
             request,
             presentation_id,
-            async_status=async_status,
-            sql_session=sql_session,
+            async_status.id,
         )
         return async_status
 
@@ -880,15 +926,14 @@ async def edit_presentation_with_new_content(
         select(SlideModel).where(SlideModel.presentation == data.presentation_id)
     )
 
+    new_slide_data_by_index = {each.index: each for each in data.slides}
+
     new_slides = []
     slides_to_delete = []
     for each_slide in slides:
-        updated_content = None
-        new_slide_data = list(
-            filter(lambda x: x.index == each_slide.index, data.slides)
-        )
+        new_slide_data = new_slide_data_by_index.get(each_slide.index)
         if new_slide_data:
-            updated_content = deep_update(each_slide.content, new_slide_data[0].content)
+            updated_content = deep_update(each_slide.content, new_slide_data.content)
             new_slides.append(
                 each_slide.get_new_slide(presentation.id, updated_content)
             )
@@ -924,15 +969,15 @@ async def derive_presentation_from_existing_one(
         select(SlideModel).where(SlideModel.presentation == data.presentation_id)
     )
 
+    new_slide_data_by_index = {each.index: each for each in data.slides}
+
     new_presentation = presentation.get_new_presentation()
     new_slides = []
     for each_slide in slides:
         updated_content = None
-        new_slide_data = list(
-            filter(lambda x: x.index == each_slide.index, data.slides)
-        )
+        new_slide_data = new_slide_data_by_index.get(each_slide.index)
         if new_slide_data:
-            updated_content = deep_update(each_slide.content, new_slide_data[0].content)
+            updated_content = deep_update(each_slide.content, new_slide_data.content)
         new_slides.append(
             each_slide.get_new_slide(new_presentation.id, updated_content)
         )
@@ -12,7 +12,6 @@ from utils.llm_calls.edit_slide import get_edited_slide_content
 from utils.llm_calls.edit_slide_html import get_edited_slide_html
 from utils.llm_calls.select_slide_type_on_edit import get_slide_layout_from_prompt
 from utils.process_slides import process_old_and_new_slides_and_fetch_assets
-import uuid
 
 
 SLIDE_ROUTER = APIRouter(prefix="/slide", tags=["Slide"])
@@ -52,7 +51,6 @@ async def edit_slide(
     # Always assign a new unique id to the slide
     slide.id = uuid.uuid4()
 
-    sql_session.add(slide)
     slide.content = edited_slide_content
     slide.layout = slide_layout.id
     slide.speaker_note = edited_slide_content.get("__speaker_note__", "")
@@ -83,7 +81,6 @@ async def edit_slide_html(
     # This is to ensure that the nextjs can track slide updates
     slide.id = uuid.uuid4()
 
-    sql_session.add(slide)
     slide.html_content = edited_slide_html
     await sql_session.commit()
 
@@ -728,6 +728,10 @@ async def save_layouts(
 
         saved_count = 0
 
+        # Collect new rows and register them with one add_all instead of
+        # per-item session.add bookkeeping inside the loop
+        new_layouts = []
+
         for i, layout_data in enumerate(request.layouts):
             # Validate individual layout data
             if (
@@ -777,10 +781,12 @@ async def save_layouts(
                     layout_code=layout_data.layout_code,
                     fonts=layout_data.fonts,
                 )
-                session.add(new_layout)
+                new_layouts.append(new_layout)
 
             saved_count += 1
 
+        if new_layouts:
+            session.add_all(new_layouts)
         await session.commit()
 
         return SaveLayoutsResponse(
@@ -932,10 +938,22 @@ async def get_presentations_summary(
         result = await session.execute(stmt)
         presentation_data = result.all()
 
+        # Prefetch template metadata for all presentations in one query
+        # instead of one SELECT per row
+        template_ids = [row.presentation for row in presentation_data]
+        template_meta_by_id = {}
+        if template_ids:
+            template_rows = await session.scalars(
+                select(TemplateModel).where(TemplateModel.id.in_(template_ids))
+            )
+            template_meta_by_id = {
+                template_row.id: template_row for template_row in template_rows
+            }
+
         # Convert to response format with template info if available
         presentations = []
         for row in presentation_data:
-            template_meta = await session.get(TemplateModel, row.presentation)
+            template_meta = template_meta_by_id.get(row.presentation)
             template = None
             if template_meta:
                 template = {
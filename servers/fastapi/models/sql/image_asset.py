@@ -12,9 +12,12 @@ class ImageAsset(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(
         sa_column=Column(
-            DateTime(timezone=True), nullable=False, default=get_current_utc_datetime
+            DateTime(timezone=True),
+            nullable=False,
+            default=get_current_utc_datetime,
+            index=True,
         ),
     )
-    is_uploaded: bool = Field(default=False)
+    is_uploaded: bool = Field(default=False, index=True)
     path: str
     extras: Optional[dict] = Field(sa_column=Column(JSON), default=None)
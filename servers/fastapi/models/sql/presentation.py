@@ -22,7 +22,10 @@ class PresentationModel(SQLModel, table=True):
     outlines: Optional[dict] = Field(sa_column=Column(JSON), default=None)
     created_at: datetime = Field(
         sa_column=Column(
-            DateTime(timezone=True), nullable=False, default=get_current_utc_datetime
+            DateTime(timezone=True),
+            nullable=False,
+            default=get_current_utc_datetime,
+            index=True,
         ),
     )
     updated_at: datetime = Field(
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 import uuid
-from sqlalchemy import Column, DateTime, Text, JSON
+from sqlalchemy import Column, DateTime, Index, Text, JSON
 from sqlmodel import SQLModel, Field
 
 from utils.datetime_utils import get_current_utc_datetime
@@ -11,10 +11,22 @@ class PresentationLayoutCodeModel(SQLModel, table=True):
     """Model for storing presentation layout codes"""
 
     __tablename__ = "presentation_layout_codes"
+    # The save path looks rows up by (presentation, layout_id) per layout;
+    # the composite index serves that lookup and presentation-only queries
+    # via its prefix
+    __table_args__ = (
+        Index(
+            "ix_presentation_layout_codes_presentation_layout_id",
+            "presentation",
+            "layout_id",
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    presentation: uuid.UUID = Field(index=True, description="UUID of the presentation")
-    layout_id: str = Field(description="Unique identifier for the layout")
+    presentation: uuid.UUID = Field(description="UUID of the presentation")
+    layout_id: str = Field(
+        index=True, description="Unique identifier for the layout"
+    )
     layout_name: str = Field(description="Display name of the layout")
     layout_code: str = Field(
         sa_column=Column(Text), description="TSX/React component code for the layout"
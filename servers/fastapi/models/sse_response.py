@@ -1,8 +1,13 @@
-import json
-
+import orjson
 from pydantic import BaseModel
 
 
+def _dumps(data: dict) -> str:
+    # orjson serializes in C and handles datetime/UUID natively, which
+    # matters on the per-chunk streaming path
+    return orjson.dumps(data).decode("utf-8")
+
+
 class SSEResponse(BaseModel):
     event: str
     data: str
@@ -16,7 +21,7 @@ class SSEStatusResponse(BaseModel):
 
     def to_string(self):
         return SSEResponse(
-            event="response", data=json.dumps({"type": "status", "status": self.status})
+            event="response", data=_dumps({"type": "status", "status": self.status})
         ).to_string()
 
 
@@ -25,7 +30,7 @@ class SSEErrorResponse(BaseModel):
 
     def to_string(self):
         return SSEResponse(
-            event="response", data=json.dumps({"type": "error", "detail": self.detail})
+            event="response", data=_dumps({"type": "error", "detail": self.detail})
         ).to_string()
 
 
@@ -36,5 +41,5 @@ class SSECompleteResponse(BaseModel):
     def to_string(self):
         return SSEResponse(
             event="response",
-            data=json.dumps({"type": "complete", self.key: self.value}),
+            data=_dumps({"type": "complete", self.key: self.value}),
         ).to_string()
@@ -24,7 +24,20 @@ from utils.db_utils import get_database_url_and_connect_args
 
 database_url, connect_args = get_database_url_and_connect_args()
 
-sql_engine: AsyncEngine = create_async_engine(database_url, connect_args=connect_args)
+engine_kwargs = {}
+if database_url.startswith("postgresql+asyncpg"):
+    # Size the pool explicitly and let asyncpg cache prepared statements,
+    # so hot parameterized queries reuse their server-side plans
+    engine_kwargs["pool_size"] = 20
+    engine_kwargs["max_overflow"] = 10
+    # Batch multi-row inserts (slides, image assets) into paged
+    # INSERT ... VALUES statements instead of one roundtrip per row
+    engine_kwargs["insertmanyvalues_page_size"] = 500
+    connect_args.setdefault("statement_cache_size", 1024)
+
+sql_engine: AsyncEngine = create_async_engine(
+    database_url, connect_args=connect_args, **engine_kwargs
+)
 async_session_maker = async_sessionmaker(sql_engine, expire_on_commit=False)
 
 
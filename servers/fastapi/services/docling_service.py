@@ -1,3 +1,6 @@
+import threading
+from typing import Optional
+
 from docling.document_converter import (
     DocumentConverter,
     PdfFormatOption,
@@ -13,6 +16,11 @@ class DoclingService:
         self.pipeline_options = PdfPipelineOptions()
         self.pipeline_options.do_ocr = False
 
+        # The converter initializes its pipelines lazily and is not
+        # documented thread-safe, so conversions on the shared instance
+        # are serialized; sharing still saves the expensive construction
+        self._convert_lock = threading.Lock()
+
         self.converter = DocumentConverter(
             allowed_formats=[InputFormat.PPTX, InputFormat.PDF, InputFormat.DOCX],
             format_options={
@@ -29,5 +37,19 @@ class DoclingService:
         )
 
     def parse_to_markdown(self, file_path: str) -> str:
-        result = self.converter.convert(file_path)
+        with self._convert_lock:
+            result = self.converter.convert(file_path)
         return result.document.export_to_markdown()
+
+
+# Building a DocumentConverter is expensive, so one instance is shared by
+# all loaders. Created lazily to keep startup cheap when no documents are
+# ever parsed.
+_docling_service: Optional[DoclingService] = None
+
+
+def get_docling_service() -> DoclingService:
+    global _docling_service
+    if _docling_service is None:
+        _docling_service = DoclingService()
+    return _docling_service
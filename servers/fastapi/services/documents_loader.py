@@ -10,7 +10,7 @@ from constants.documents import (
     TEXT_MIME_TYPES,
     WORD_TYPES,
 )
-from services.docling_service import DoclingService
+from services.docling_service import get_docling_service
 
 
 class DocumentsLoader:
@@ -18,7 +18,7 @@ class DocumentsLoader:
     def __init__(self, file_paths: List[str]):
         self._file_paths = file_paths
 
-        self.docling_service = DoclingService()
+        self.docling_service = get_docling_service()
 
         self._documents: List[str] = []
         self._images: List[List[str]] = []
@@ -39,35 +39,43 @@ class DocumentsLoader:
     ):
         """If load_images is True, temp_dir must be provided"""
 
-        documents: List[str] = []
-        images: List[str] = []
-
         for file_path in self._file_paths:
             if not os.path.exists(file_path):
                 raise HTTPException(
                     status_code=404, detail=f"File {file_path} not found"
                 )
 
-            document = ""
-            imgs = []
-
-            mime_type = mimetypes.guess_type(file_path)[0]
-            if mime_type in PDF_MIME_TYPES:
-                document, imgs = await self.load_pdf(
-                    file_path, load_text, load_images, temp_dir
-                )
-            elif mime_type in TEXT_MIME_TYPES:
-                document = await self.load_text(file_path)
-            elif mime_type in POWERPOINT_TYPES:
-                document = self.load_powerpoint(file_path)
-            elif mime_type in WORD_TYPES:
-                document = self.load_msword(file_path)
-
-            documents.append(document)
-            images.append(imgs)
+        # Parsing happens in worker threads, so files can be loaded
+        # concurrently with a bound to avoid saturating the thread pool
+        semaphore = asyncio.Semaphore(4)
+
+        async def load_each_file(file_path: str) -> Tuple[str, List[str]]:
+            async with semaphore:
+                document = ""
+                imgs = []
+
+                mime_type = mimetypes.guess_type(file_path)[0]
+                if mime_type in PDF_MIME_TYPES:
+                    document, imgs = await self.load_pdf(
+                        file_path, load_text, load_images, temp_dir
+                    )
+                elif mime_type in TEXT_MIME_TYPES:
+                    document = await self.load_text(file_path)
+                elif mime_type in POWERPOINT_TYPES:
+                    document = await asyncio.to_thread(
+                        self.load_powerpoint, file_path
+                    )
+                elif mime_type in WORD_TYPES:
+                    document = await asyncio.to_thread(self.load_msword, file_path)
+
+                return document, imgs
+
+        results = await asyncio.gather(
+            *[load_each_file(file_path) for file_path in self._file_paths]
+        )
 
-        self._documents = documents
-        self._images = images
+        self._documents = [document for document, _ in results]
+        self._images = [imgs for _, imgs in results]
 
     async def load_pdf(
         self,
@@ -80,7 +88,9 @@ class DocumentsLoader:
         document: str = ""
 
         if load_text:
-            document = self.docling_service.parse_to_markdown(file_path)
+            document = await asyncio.to_thread(
+                self.docling_service.parse_to_markdown, file_path
+            )
 
         if load_images:
             image_paths = await self.get_page_images_from_pdf_async(file_path, temp_dir)
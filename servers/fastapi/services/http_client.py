@@ -0,0 +1,37 @@
+from typing import Optional
+
+import aiohttp
+
+
+class HttpClientService:
+    """
+    Shares a single aiohttp session (and its connection pool) across
+    services, so outbound calls reuse keep-alive connections instead of
+    paying a fresh TCP/TLS handshake per request.
+    """
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        # getattr guards against cached test doubles without a closed
+        # attribute; anything unrecognizable is treated as closed and
+        # replaced with a real session
+        if self._session is None or getattr(self._session, "closed", True):
+            self._session = aiohttp.ClientSession(
+                trust_env=True,
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                ),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+HTTP_CLIENT_SERVICE = HttpClientService()
@@ -4,6 +4,12 @@ import chromadb
 from chromadb.config import Settings
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
 
+# Icon search is deterministic for a given query, so repeated queries
+# (common across slides and regenerations) skip the embedding + vector
+# lookup entirely
+_ICON_SEARCH_CACHE: dict = {}
+_ICON_SEARCH_CACHE_MAX_SIZE = 2048
+
 
 class IconFinderService:
     def __init__(self):
@@ -45,12 +51,22 @@ class IconFinderService:
                 self.collection.add(documents=documents, ids=ids)
 
     async def search_icons(self, query: str, k: int = 1):
+        cache_key = f"{query}:{k}"
+        cached_icons = _ICON_SEARCH_CACHE.get(cache_key)
+        if cached_icons is not None:
+            return cached_icons
+
         result = await asyncio.to_thread(
             self.collection.query,
             query_texts=[query],
             n_results=k,
         )
-        return [f"/static/icons/bold/{each}.svg" for each in result["ids"][0]]
+        icons = [f"/static/icons/bold/{each}.svg" for each in result["ids"][0]]
+
+        if len(_ICON_SEARCH_CACHE) >= _ICON_SEARCH_CACHE_MAX_SIZE:
+            _ICON_SEARCH_CACHE.clear()
+        _ICON_SEARCH_CACHE[cache_key] = icons
+        return icons
 
 
 ICON_FINDER_SERVICE = IconFinderService()
@@ -2,12 +2,15 @@ import asyncio
 import base64
 import json
 import os
+import aiofiles
 import aiohttp
 from fastapi import HTTPException
 from google import genai
 from openai import NOT_GIVEN, AsyncOpenAI
 from models.image_prompt import ImagePrompt
 from models.sql.image_asset import ImageAsset
+from services.http_client import HTTP_CLIENT_SERVICE
+from utils.download_helpers import DOWNLOAD_CHUNK_SIZE
 from utils.get_env import (
     get_dall_e_3_quality_env,
     get_gpt_image_1_5_quality_env,
@@ -28,6 +31,17 @@ from utils.image_provider import (
 )
 import uuid
 
+# Stock-provider lookups are deterministic for a given prompt, so identical
+# prompts (repeated generations, retries, edits) can skip the API round-trip
+_STOCK_IMAGE_URL_CACHE: dict = {}
+_STOCK_IMAGE_URL_CACHE_MAX_SIZE = 2048
+
+# A whole presentation's slides fetch assets concurrently; bound the
+# in-flight provider calls so a large deck doesn't hammer the provider
+# (or trip its rate limits) all at once
+MAX_CONCURRENT_IMAGE_GENERATIONS = 8
+_image_generation_semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_GENERATIONS)
+
 
 class ImageGenerationService:
     def __init__(self, output_directory: str):
@@ -80,12 +94,13 @@ class ImageGenerationService:
         print(f"Request - Generating Image for {image_prompt}")
 
         try:
-            if self.is_stock_provider_selected():
-                image_path = await self.image_gen_func(image_prompt)
-            else:
-                image_path = await self.image_gen_func(
-                    image_prompt, self.output_directory
-                )
+            async with _image_generation_semaphore:
+                if self.is_stock_provider_selected():
+                    image_path = await self.image_gen_func(image_prompt)
+                else:
+                    image_path = await self.image_gen_func(
+                        image_prompt, self.output_directory
+                    )
             if image_path:
                 if image_path.startswith("http"):
                     return image_path
@@ -182,24 +197,42 @@ class ImageGenerationService:
             prompt, output_directory, "gemini-3-pro-image-preview"
         )
 
+    def _get_cached_stock_image_url(self, provider: str, prompt: str) -> str | None:
+        return _STOCK_IMAGE_URL_CACHE.get(f"{provider}:{prompt}")
+
+    def _cache_stock_image_url(self, provider: str, prompt: str, image_url: str):
+        if len(_STOCK_IMAGE_URL_CACHE) >= _STOCK_IMAGE_URL_CACHE_MAX_SIZE:
+            _STOCK_IMAGE_URL_CACHE.clear()
+        _STOCK_IMAGE_URL_CACHE[f"{provider}:{prompt}"] = image_url
+
     async def get_image_from_pexels(self, prompt: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://api.pexels.com/v1/search?query={prompt}&per_page=1",
-                headers={"Authorization": f"{get_pexels_api_key_env()}"},
-            )
+        cached_image_url = self._get_cached_stock_image_url("pexels", prompt)
+        if cached_image_url:
+            return cached_image_url
+
+        session = HTTP_CLIENT_SERVICE.get_session()
+        async with session.get(
+            f"https://api.pexels.com/v1/search?query={prompt}&per_page=1",
+            headers={"Authorization": f"{get_pexels_api_key_env()}"},
+        ) as response:
             data = await response.json()
-            image_url = data["photos"][0]["src"]["large"]
-            return image_url
+        image_url = data["photos"][0]["src"]["large"]
+        self._cache_stock_image_url("pexels", prompt, image_url)
+        return image_url
 
     async def get_image_from_pixabay(self, prompt: str) -> str:
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            response = await session.get(
-                f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={prompt}&image_type=photo&per_page=3"
-            )
+        cached_image_url = self._get_cached_stock_image_url("pixabay", prompt)
+        if cached_image_url:
+            return cached_image_url
+
+        session = HTTP_CLIENT_SERVICE.get_session()
+        async with session.get(
+            f"https://pixabay.com/api/?key={get_pixabay_api_key_env()}&q={prompt}&image_type=photo&per_page=3"
+        ) as response:
             data = await response.json()
-            image_url = data["hits"][0]["largeImageURL"]
-            return image_url
+        image_url = data["hits"][0]["largeImageURL"]
+        self._cache_stock_image_url("pixabay", prompt, image_url)
+        return image_url
 
     async def generate_image_comfyui(self, prompt: str, output_directory: str) -> str:
         """
@@ -242,23 +275,22 @@ class ImageGenerationService:
         # Find and update the positive prompt node
         workflow = self._inject_prompt_into_workflow(workflow, prompt)
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            # Step 1: Submit workflow
-            prompt_id = await self._submit_comfyui_workflow(
-                session, comfyui_url, workflow
-            )
+        session = HTTP_CLIENT_SERVICE.get_session()
 
-            # Step 2: Wait for completion
-            status_data = await self._wait_for_comfyui_completion(
-                session, comfyui_url, prompt_id
-            )
+        # Step 1: Submit workflow
+        prompt_id = await self._submit_comfyui_workflow(session, comfyui_url, workflow)
 
-            # Step 3: Download the generated image
-            image_path = await self._download_comfyui_image(
-                session, comfyui_url, status_data, prompt_id, output_directory
-            )
+        # Step 2: Wait for completion
+        status_data = await self._wait_for_comfyui_completion(
+            session, comfyui_url, prompt_id
+        )
 
-            return image_path
+        # Step 3: Download the generated image
+        image_path = await self._download_comfyui_image(
+            session, comfyui_url, status_data, prompt_id, output_directory
+        )
+
+        return image_path
 
     def _inject_prompt_into_workflow(self, workflow: dict, prompt: str) -> dict:
         """
@@ -268,15 +300,14 @@ class ImageGenerationService:
         User must rename their prompt node to 'Input Prompt' in ComfyUI.
         """
         for node_id, node_data in workflow.items():
-            meta = node_data.get("_meta", {})
-            title = meta.get("title", "").lower()
-
-            if title == "input prompt":
-                if "inputs" in node_data and "text" in node_data["inputs"]:
-                    node_data["inputs"]["text"] = prompt
-                    print(
-                        f"Injected prompt into node {node_id}: {meta.get('title', '')}"
-                    )
+            # Bind nested lookups once instead of re-walking the dicts
+            title = node_data.get("_meta", {}).get("title", "")
+
+            if title.lower() == "input prompt":
+                inputs = node_data.get("inputs")
+                if inputs is not None and "text" in inputs:
+                    inputs["text"] = prompt
+                    print(f"Injected prompt into node {node_id}: {title}")
                     return workflow
 
         raise ValueError(
@@ -290,17 +321,16 @@ class ImageGenerationService:
         client_id = str(uuid.uuid4())
         payload = {"prompt": workflow, "client_id": client_id}
 
-        response = await session.post(
+        async with session.post(
             f"{comfyui_url}/prompt",
             json=payload,
             timeout=aiohttp.ClientTimeout(total=30),
-        )
-
-        if response.status != 200:
-            error_text = await response.text()
-            raise Exception(f"Failed to submit workflow to ComfyUI: {error_text}")
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Failed to submit workflow to ComfyUI: {error_text}")
 
-        data = await response.json()
+            data = await response.json()
         prompt_id = data.get("prompt_id")
 
         if not prompt_id:
@@ -327,18 +357,17 @@ class ImageGenerationService:
 
             await asyncio.sleep(poll_interval)
 
-            response = await session.get(
+            async with session.get(
                 f"{comfyui_url}/history/{prompt_id}",
                 timeout=aiohttp.ClientTimeout(total=30),
-            )
+            ) as response:
+                if response.status != 200:
+                    continue
 
-            if response.status != 200:
-                continue
-
-            try:
-                status_data = await response.json()
-            except Exception as _:
-                continue
+                try:
+                    status_data = await response.json()
+                except Exception as _:
+                    continue
 
             if prompt_id in status_data:
                 execution_data = status_data[prompt_id]
@@ -389,27 +418,31 @@ class ImageGenerationService:
                         params["subfolder"] = subfolder
 
                     # Download the image
-                    response = await session.get(
+                    async with session.get(
                         f"{comfyui_url}/view",
                         params=params,
                         timeout=aiohttp.ClientTimeout(total=60),
-                    )
-
-                    if response.status == 200:
-                        image_data = await response.read()
-
-                        # Determine extension
-                        ext = filename.split(".")[-1] if "." in filename else "png"
-                        image_path = os.path.join(
-                            output_directory, f"{uuid.uuid4()}.{ext}"
-                        )
-
-                        with open(image_path, "wb") as f:
-                            f.write(image_data)
-
-                        print(f"Downloaded image from ComfyUI: {image_path}")
-                        return image_path
-                    else:
-                        raise Exception(f"Failed to download image: {response.status}")
+                    ) as response:
+                        if response.status == 200:
+                            # Determine extension
+                            ext = filename.split(".")[-1] if "." in filename else "png"
+                            image_path = os.path.join(
+                                output_directory, f"{uuid.uuid4()}.{ext}"
+                            )
+
+                            # Stream to disk instead of buffering the whole
+                            # image in memory first
+                            async with aiofiles.open(image_path, "wb") as f:
+                                async for chunk in response.content.iter_chunked(
+                                    DOWNLOAD_CHUNK_SIZE
+                                ):
+                                    await f.write(chunk)
+
+                            print(f"Downloaded image from ComfyUI: {image_path}")
+                            return image_path
+                        else:
+                            raise Exception(
+                                f"Failed to download image: {response.status}"
+                            )
 
         raise Exception("No images found in ComfyUI outputs")
@@ -1613,3 +1613,32 @@ class LLMClient:
             [each.text for each in response.content if each.type == "text"]
         )
         return result
+
+
+# Reuse one LLMClient (and its underlying HTTP connection pool) across
+# calls. The instance is keyed by a snapshot of the provider settings so
+# config changes made through the user-config middleware still take effect.
+_llm_client: Optional[LLMClient] = None
+_llm_client_config: Optional[tuple] = None
+
+
+def _get_llm_provider_config() -> tuple:
+    return (
+        get_llm_provider(),
+        get_openai_api_key_env(),
+        get_google_api_key_env(),
+        get_anthropic_api_key_env(),
+        get_ollama_url_env(),
+        get_custom_llm_url_env(),
+        get_custom_llm_api_key_env(),
+    )
+
+
+def get_llm_client() -> LLMClient:
+    global _llm_client, _llm_client_config
+
+    config = _get_llm_provider_config()
+    if _llm_client is None or config != _llm_client_config:
+        _llm_client = LLMClient()
+        _llm_client_config = config
+    return _llm_client
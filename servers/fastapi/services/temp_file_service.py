@@ -47,21 +47,32 @@ class TempFileService:
             return f.read()
 
     def cleanup_temp_file(self, file_path: str):
-        if os.path.exists(file_path):
+        # Remove directly instead of exists-then-remove; avoids an extra
+        # stat and the race where the file disappears between the two
+        try:
             os.remove(file_path)
+        except FileNotFoundError:
+            pass
 
     def delete_dir_files(self, dir_path: str):
-        if os.path.exists(dir_path):
-            for root, dirs, files in os.walk(dir_path, topdown=False):
-                for name in files:
+        for root, dirs, files in os.walk(dir_path, topdown=False):
+            for name in files:
+                try:
                     os.remove(os.path.join(root, name))
-                for name in dirs:
+                except FileNotFoundError:
+                    pass
+            for name in dirs:
+                try:
                     os.rmdir(os.path.join(root, name))
+                except FileNotFoundError:
+                    pass
 
     def cleanup_temp_dir(self, dir_path: str):
-        if os.path.exists(dir_path):
-            self.delete_dir_files(dir_path)
+        self.delete_dir_files(dir_path)
+        try:
             os.rmdir(dir_path)
+        except FileNotFoundError:
+            pass
 
     def cleanup_base_dir(self):
         self.cleanup_temp_dir(self.base_dir)
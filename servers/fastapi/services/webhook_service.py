@@ -1,9 +1,15 @@
 import asyncio
-import aiohttp
 from sqlmodel import select
 from enums.webhook_event import WebhookEvent
 from models.sql.webhook_subscription import WebhookSubscription
 from services.database import get_async_session
+from services.http_client import HTTP_CLIENT_SERVICE
+
+# Built once at import; per-request copies only add the subscription's
+# Authorization header when a secret is configured
+_BASE_WEBHOOK_HEADERS = {
+    "Content-Type": "application/json",
+}
 
 
 class WebhookService:
@@ -11,12 +17,16 @@ class WebhookService:
     @classmethod
     async def send_webhook(cls, event: WebhookEvent, data: dict):
         async for sql_session in get_async_session():
-            webhook_subscriptions = await sql_session.scalars(
-                select(WebhookSubscription).where(
-                    WebhookSubscription.event == event.value
-                )
+            # Only id, url and secret are needed to deliver the webhook, so
+            # select plain rows instead of hydrating full ORM instances
+            result = await sql_session.execute(
+                select(
+                    WebhookSubscription.id,
+                    WebhookSubscription.url,
+                    WebhookSubscription.secret,
+                ).where(WebhookSubscription.event == event.value)
             )
-            webhook_subscriptions = list(webhook_subscriptions)
+            webhook_subscriptions = result.all()
             if not webhook_subscriptions:
                 return
 
@@ -31,24 +41,22 @@ class WebhookService:
             break
 
     @classmethod
-    async def send_request_to_webhook(
-        cls, subscription: WebhookSubscription, data: dict
-    ):
+    async def send_request_to_webhook(cls, subscription, data: dict):
+        # subscription is any row with id, url and secret attributes
 
-        headers = {
-            "Content-Type": "application/json",
-        }
+        headers = _BASE_WEBHOOK_HEADERS
         if subscription.secret:
+            headers = dict(_BASE_WEBHOOK_HEADERS)
             headers["Authorization"] = f"Bearer {subscription.secret}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    subscription.url,
-                    json=data,
-                    headers=headers,
-                ) as _:
-                    pass
+            session = HTTP_CLIENT_SERVICE.get_session()
+            async with session.post(
+                subscription.url,
+                json=data,
+                headers=headers,
+            ) as _:
+                pass
 
         except Exception as e:
             print(f"Error sending request to webhook {subscription.id}: {e}")
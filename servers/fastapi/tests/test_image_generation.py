@@ -31,6 +31,29 @@ class TestImageGenerationService:
         Creates a sample ImagePrompt for testing
         """
         return ImagePrompt(prompt="A beautiful sunset over mountains")
+
+    @pytest.fixture(autouse=True)
+    def clear_stock_image_cache(self):
+        """
+        Clears the module-level stock image cache so cached URLs from one
+        test don't short-circuit the HTTP call in another
+        """
+        from services.image_generation_service import _STOCK_IMAGE_URL_CACHE
+        _STOCK_IMAGE_URL_CACHE.clear()
+        yield
+
+    def _make_mock_session(self, mock_response):
+        """
+        Builds a mock shared session whose get() returns an async context
+        manager yielding mock_response, matching aiohttp's call pattern
+        """
+        mock_get_cm = AsyncMock()
+        mock_get_cm.__aenter__.return_value = mock_response
+        mock_get_cm.__aexit__.return_value = None
+
+        mock_session = Mock()
+        mock_session.get = Mock(return_value=mock_get_cm)
+        return mock_session
     
     def test_image_generation_service_initialization(self, mock_images_directory):
         """
@@ -132,13 +155,10 @@ class TestImageGenerationService:
                                         }
                                     }]
                                 })
-                                
-                                mock_session = AsyncMock()
-                                mock_session.get = AsyncMock(return_value=mock_response)
-                                mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-                                mock_session.__aexit__ = AsyncMock(return_value=None)
-                                
-                                with patch('aiohttp.ClientSession', return_value=mock_session):
+
+                                mock_session = self._make_mock_session(mock_response)
+
+                                with patch('services.image_generation_service.HTTP_CLIENT_SERVICE.get_session', return_value=mock_session):
                                     result = await service.generate_image(sample_image_prompt)
                                     assert result == "https://example.com/image.jpg"
         
@@ -244,15 +264,12 @@ class TestImageGenerationService:
                         }
                     }]
                 })
-                
-                mock_session = AsyncMock()
-                mock_session.get = AsyncMock(return_value=mock_response)
-                mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-                mock_session.__aexit__ = AsyncMock(return_value=None)
-                
-                with patch('aiohttp.ClientSession', return_value=mock_session):
+
+                mock_session = self._make_mock_session(mock_response)
+
+                with patch('services.image_generation_service.HTTP_CLIENT_SERVICE.get_session', return_value=mock_session):
                     result = await service.get_image_from_pexels("sunset")
-                    
+
                     assert result == "https://example.com/pexels_image.jpg"
                     mock_session.get.assert_called_once()
         
@@ -275,15 +292,12 @@ class TestImageGenerationService:
                         "largeImageURL": "https://example.com/pixabay_image.jpg"
                     }]
                 })
-                
-                mock_session = AsyncMock()
-                mock_session.get = AsyncMock(return_value=mock_response)
-                mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-                mock_session.__aexit__ = AsyncMock(return_value=None)
-                
-                with patch('aiohttp.ClientSession', return_value=mock_session):
+
+                mock_session = self._make_mock_session(mock_response)
+
+                with patch('services.image_generation_service.HTTP_CLIENT_SERVICE.get_session', return_value=mock_session):
                     result = await service.get_image_from_pixabay("sunset")
-                    
+
                     assert result == "https://example.com/pixabay_image.jpg"
                     mock_session.get.assert_called_once()
         
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch, AsyncMock, MagicMock
 import pytest
 from fastapi.testclient import TestClient
@@ -17,7 +18,11 @@ class MockAiohttpResponse:
     async def __aexit__(self, exc_type, exc, tb):
         pass
 
-    async def json(self):
+    async def json(self, loads=None):
+        # aiohttp's response.json accepts a loads callable; honor it so
+        # callers passing orjson.loads exercise the same path
+        if loads is not None:
+            return loads(json.dumps(self._json_data))
         return self._json_data
 
     async def text(self):
@@ -99,7 +104,7 @@ def patch_presentation_api(monkeypatch, mock_get_layout):
         patch('api.v1.ppt.endpoints.presentation.process_slide_and_fetch_assets', new_callable=AsyncMock),
         patch('api.v1.ppt.endpoints.presentation.get_exports_directory', return_value='/tmp/exports'),
         patch('api.v1.ppt.endpoints.presentation.PptxPresentationCreator'),
-        patch('api.v1.ppt.endpoints.presentation.aiohttp.ClientSession', return_value=MockAiohttpSession()),
+        patch('services.http_client.HTTP_CLIENT_SERVICE.get_session', return_value=MockAiohttpSession()),
     ]
     mocks = [p.start() for p in patches]
 
@@ -1,19 +1,27 @@
 import os
+from typing import Set
+
 from utils.get_env import get_app_data_directory_env
 
+# Directories we have already created this process; lets the hot path skip
+# the makedirs syscall after the first request
+_created_directories: Set[str] = set()
+
+
+def _ensure_directory(directory: str) -> str:
+    if directory not in _created_directories:
+        os.makedirs(directory, exist_ok=True)
+        _created_directories.add(directory)
+    return directory
+
 
 def get_images_directory():
-    images_directory = os.path.join(get_app_data_directory_env(), "images")
-    os.makedirs(images_directory, exist_ok=True)
-    return images_directory
+    return _ensure_directory(os.path.join(get_app_data_directory_env(), "images"))
 
 
 def get_exports_directory():
-    export_directory = os.path.join(get_app_data_directory_env(), "exports")
-    os.makedirs(export_directory, exist_ok=True)
-    return export_directory
+    return _ensure_directory(os.path.join(get_app_data_directory_env(), "exports"))
+
 
 def get_uploads_directory():
-    uploads_directory = os.path.join(get_app_data_directory_env(), "uploads")
-    os.makedirs(uploads_directory, exist_ok=True)
-    return uploads_directory
+    return _ensure_directory(os.path.join(get_app_data_directory_env(), "uploads"))
@@ -2,8 +2,19 @@ import os
 from typing import BinaryIO
 import uuid
 
+import aiofiles
 from fastapi import UploadFile
 
+# Uploads are streamed to disk in chunks of this size instead of being
+# buffered fully in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def save_upload_file(file: UploadFile, file_path: str):
+    async with aiofiles.open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
+
 
 def replace_file_name(filename: str, new_stem: str) -> str:
     _, ext = os.path.splitext(filename)
@@ -1,9 +1,23 @@
+import time
+from typing import Dict, Tuple
+
 import aiohttp
+import orjson
 from fastapi import HTTPException
 from models.presentation_layout import PresentationLayoutModel
-from typing import List
+
+# Layouts only change when templates are edited, so serve repeat lookups
+# from memory for a short window instead of re-fetching from the Next.js
+# service on every generation
+LAYOUT_CACHE_TTL = 60
+_layout_cache: Dict[str, Tuple[float, PresentationLayoutModel]] = {}
+
 
 async def get_layout_by_name(layout_name: str) -> PresentationLayoutModel:
+    cached = _layout_cache.get(layout_name)
+    if cached and (time.monotonic() - cached[0]) < LAYOUT_CACHE_TTL:
+        return cached[1]
+
     url = f"http://localhost/api/template?group={layout_name}"
     async with aiohttp.ClientSession() as session:
         async with session.get(url) as response:
@@ -13,6 +27,8 @@ async def get_layout_by_name(layout_name: str) -> PresentationLayoutModel:
                     status_code=404,
                     detail=f"Template '{layout_name}' not found: {error_text}"
                 )
-            layout_json = await response.json()
+            layout_json = await response.json(loads=orjson.loads)
     # Parse the JSON into your Pydantic model
-    return PresentationLayoutModel(**layout_json)
+    layout = PresentationLayoutModel(**layout_json)
+    _layout_cache[layout_name] = (time.monotonic(), layout)
+    return layout
@@ -1,6 +1,6 @@
 from typing import Optional
 from models.llm_message import LLMSystemMessage, LLMUserMessage
-from services.llm_client import LLMClient
+from services.llm_client import get_llm_client
 from utils.llm_client_error_handler import handle_llm_client_exceptions
 from utils.llm_provider import get_model
 
@@ -50,7 +50,7 @@ def get_user_prompt(prompt: str, html: str):
 async def get_edited_slide_html(prompt: str, html: str):
     model = get_model()
 
-    client = LLMClient()
+    client = get_llm_client()
     try:
         response = await client.generate(
             model=model,
@@ -3,7 +3,7 @@ from typing import Optional
 
 from models.llm_message import LLMSystemMessage, LLMUserMessage
 from models.llm_tools import SearchWebTool
-from services.llm_client import LLMClient
+from services.llm_client import get_llm_client
 from utils.get_dynamic_models import get_presentation_outline_model_with_n_slides
 from utils.llm_client_error_handler import handle_llm_client_exceptions
 from utils.llm_provider import get_model
@@ -96,7 +96,7 @@ async def generate_ppt_outline(
     model = get_model()
     response_model = get_presentation_outline_model_with_n_slides(n_slides)
 
-    client = LLMClient()
+    client = get_llm_client()
 
     try:
         async for chunk in client.stream_structured(
@@ -2,7 +2,7 @@ from typing import Optional
 from models.llm_message import LLMSystemMessage, LLMUserMessage
 from models.presentation_layout import PresentationLayoutModel
 from models.presentation_outline_model import PresentationOutlineModel
-from services.llm_client import LLMClient
+from services.llm_client import get_llm_client
 from utils.llm_client_error_handler import handle_llm_client_exceptions
 from utils.llm_provider import get_model
 from utils.get_dynamic_models import get_presentation_structure_model_with_n_slides
@@ -102,7 +102,7 @@ async def generate_presentation_structure(
     using_slides_markdown: bool = False,
 ) -> PresentationStructureModel:
 
-    client = LLMClient()
+    client = get_llm_client()
     model = get_model()
     response_model = get_presentation_structure_model_with_n_slides(
         len(presentation_outline.slides)
@@ -1,14 +1,45 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from models.llm_message import LLMSystemMessage, LLMUserMessage
 from models.presentation_layout import SlideLayoutModel
 from models.presentation_outline_model import SlideOutlineModel
-from services.llm_client import LLMClient
+from services.llm_client import get_llm_client
 from utils.llm_client_error_handler import handle_llm_client_exceptions
 from utils.llm_provider import get_model
 from utils.schema_utils import add_field_in_schema, remove_fields_from_schema
 
 
+# The response schema depends only on the slide layout, so derive it once
+# per layout instead of deep-copying and rewriting the layout schema for
+# every slide. The source schema dict is kept alongside the derived one so
+# a layout with the same id but a different schema is recomputed.
+_response_schema_cache: Dict[str, Tuple[dict, dict]] = {}
+
+
+def _get_response_schema(slide_layout: SlideLayoutModel) -> dict:
+    cached = _response_schema_cache.get(slide_layout.id)
+    if cached and cached[0] is slide_layout.json_schema:
+        return cached[1]
+
+    response_schema = remove_fields_from_schema(
+        slide_layout.json_schema, ["__image_url__", "__icon_url__"]
+    )
+    response_schema = add_field_in_schema(
+        response_schema,
+        {
+            "__speaker_note__": {
+                "type": "string",
+                "minLength": 100,
+                "maxLength": 250,
+                "description": "Speaker note for the slide",
+            }
+        },
+        True,
+    )
+    _response_schema_cache[slide_layout.id] = (slide_layout.json_schema, response_schema)
+    return response_schema
+
+
 def get_system_prompt(
     tone: Optional[str] = None,
     verbosity: Optional[str] = None,
@@ -106,24 +137,10 @@ async def get_slide_content_from_type_and_outline(
     verbosity: Optional[str] = None,
     instructions: Optional[str] = None,
 ):
-    client = LLMClient()
+    client = get_llm_client()
     model = get_model()
 
-    response_schema = remove_fields_from_schema(
-        slide_layout.json_schema, ["__image_url__", "__icon_url__"]
-    )
-    response_schema = add_field_in_schema(
-        response_schema,
-        {
-            "__speaker_note__": {
-                "type": "string",
-                "minLength": 100,
-                "maxLength": 250,
-                "description": "Speaker note for the slide",
-            }
-        },
-        True,
-    )
+    response_schema = _get_response_schema(slide_layout)
 
     try:
         response = await client.generate_structured(
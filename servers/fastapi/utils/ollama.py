@@ -1,5 +1,6 @@
-import json
 from typing import AsyncGenerator
+
+import orjson
 import aiohttp
 from fastapi import HTTPException
 
@@ -24,8 +25,8 @@ async def pull_ollama_model(model: str) -> AsyncGenerator[dict, None]:
                     continue
 
                 try:
-                    event = json.loads(line.decode("utf-8"))
-                except json.JSONDecodeError:
+                    event = orjson.loads(line)
+                except orjson.JSONDecodeError:
                     continue
 
                 yield event
@@ -37,7 +38,7 @@ async def list_pulled_ollama_models() -> list[OllamaModelStatus]:
             f"{get_ollama_url_env() or 'http://localhost:11434'}/api/tags",
         ) as response:
             if response.status == 200:
-                pulled_models = await response.json()
+                pulled_models = await response.json(loads=orjson.loads)
                 return [
                     OllamaModelStatus(
                         name=m["model"],
@@ -5,6 +5,15 @@ from typing import List
 
 from models.presentation_structure_model import PresentationStructureModel
 
+# Compiled once at import so repeated title extraction and layout matching
+# don't re-compile the same patterns per call
+_PAGE_PREFIX_REGEX = re.compile(r"^\s*#{1,6}\s*Page\s+\d+\b")
+_PAGE_PREFIX_STRIP_REGEX = re.compile(r"^\s*#{1,6}\s*Page\s+\d+\b[\s,:\-]*")
+
+# Single-pass translation table for title cleanup instead of chained
+# str.replace copies
+_TITLE_CLEANUP_TABLE = str.maketrans({"#": None, "/": None, "\\": None, "\n": " "})
+
 
 def get_presentation_title_from_outlines(
     presentation_outlines: PresentationOutlineModel,
@@ -14,28 +23,20 @@ def get_presentation_title_from_outlines(
 
     first_content = presentation_outlines.slides[0].content or ""
 
-    if re.match(r"^\s*#{1,6}\s*Page\s+\d+\b", first_content):
-        first_content = re.sub(
-            r"^\s*#{1,6}\s*Page\s+\d+\b[\s,:\-]*",
+    if _PAGE_PREFIX_REGEX.match(first_content):
+        first_content = _PAGE_PREFIX_STRIP_REGEX.sub(
             "",
             first_content,
             count=1,
         )
 
-    return (
-        first_content[:100]
-        .replace("#", "")
-        .replace("/", "")
-        .replace("\\", "")
-        .replace("\n", " ")
-    )
+    return first_content[:100].translate(_TITLE_CLEANUP_TABLE)
 
 
 def find_slide_layout_index_by_regex(
-    layout: PresentationLayoutModel, patterns: List[str]
+    layout: PresentationLayoutModel, patterns: List[re.Pattern]
 ) -> int:
-    def _find_index(pattern: str) -> int:
-        regex = re.compile(pattern, re.IGNORECASE)
+    def _find_index(regex: re.Pattern) -> int:
         for index, slide_layout in enumerate(layout.slides):
             candidates = [
                 slide_layout.id or "",
@@ -56,10 +57,9 @@ def find_slide_layout_index_by_regex(
     return -1
 
 
-def select_toc_or_list_slide_layout_index(
-    layout: PresentationLayoutModel,
-) -> int:
-    toc_patterns = [
+_TOC_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"\btable\s*of\s*contents\b",
         r"\btable[- ]?of[- ]?contents\b",
         r"\bagenda\b",
@@ -67,16 +67,24 @@ def select_toc_or_list_slide_layout_index(
         r"\boutline\b",
         r"\bindex\b",
         r"\btoc\b",
-    ]
+    )
+]
 
-    list_patterns = [
+_LIST_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
         r"\b(bullet(ed)?\s*list|bullets?)\b",
         r"\b(numbered\s*list|ordered\s*list|unordered\s*list)\b",
         r"\blist\b",
-    ]
+    )
+]
+
 
-    toc_index = find_slide_layout_index_by_regex(layout, toc_patterns)
+def select_toc_or_list_slide_layout_index(
+    layout: PresentationLayoutModel,
+) -> int:
+    toc_index = find_slide_layout_index_by_regex(layout, _TOC_PATTERNS)
     if toc_index != -1:
         return toc_index
 
-    return find_slide_layout_index_by_regex(layout, list_patterns)
+    return find_slide_layout_index_by_regex(layout, _LIST_PATTERNS)
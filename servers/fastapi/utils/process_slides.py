@@ -74,18 +74,22 @@ async def process_old_and_new_slides_and_fetch_assets(
     old_image_dicts = [
         get_dict_at_path(old_slide_content, path) for path in old_image_dict_paths
     ]
-    old_image_prompts = [
-        old_image_dict["__image_prompt__"] for old_image_dict in old_image_dicts
-    ]
+    # Map prompt -> url once so reused prompts are matched by lookup
+    # instead of a list scan per new image
+    old_image_url_by_prompt = {
+        old_image_dict["__image_prompt__"]: old_image_dict["__image_url__"]
+        for old_image_dict in old_image_dicts
+    }
 
     # Finds all old icons
     old_icon_dict_paths = get_dict_paths_with_key(old_slide_content, "__icon_query__")
     old_icon_dicts = [
         get_dict_at_path(old_slide_content, path) for path in old_icon_dict_paths
     ]
-    old_icon_queries = [
-        old_icon_dict["__icon_query__"] for old_icon_dict in old_icon_dicts
-    ]
+    old_icon_url_by_query = {
+        old_icon_dict["__icon_query__"]: old_icon_dict["__icon_url__"]
+        for old_icon_dict in old_icon_dicts
+    }
 
     # Finds all new images
     new_image_dict_paths = get_dict_paths_with_key(
@@ -112,10 +116,8 @@ async def process_old_and_new_slides_and_fetch_assets(
     # Creates async tasks for fetching new images
     # Use old image url if prompt is same
     for new_image in new_image_dicts:
-        if new_image["__image_prompt__"] in old_image_prompts:
-            old_image_url = old_image_dicts[
-                old_image_prompts.index(new_image["__image_prompt__"])
-            ]["__image_url__"]
+        old_image_url = old_image_url_by_prompt.get(new_image["__image_prompt__"])
+        if old_image_url is not None:
             new_image["__image_url__"] = old_image_url
             new_images_fetch_status.append(False)
             continue
@@ -132,10 +134,8 @@ async def process_old_and_new_slides_and_fetch_assets(
     # Creates async tasks for fetching new icons
     # Use old icon url if query is same
     for new_icon in new_icon_dicts:
-        if new_icon["__icon_query__"] in old_icon_queries:
-            old_icon_url = old_icon_dicts[
-                old_icon_queries.index(new_icon["__icon_query__"])
-            ]["__icon_url__"]
+        old_icon_url = old_icon_url_by_query.get(new_icon["__icon_query__"])
+        if old_icon_url is not None:
             new_icon["__icon_url__"] = old_icon_url
             new_icons_fetch_status.append(False)
             continue
@@ -145,8 +145,13 @@ async def process_old_and_new_slides_and_fetch_assets(
         )
         new_icons_fetch_status.append(True)
 
-    new_images = await asyncio.gather(*async_image_fetch_tasks)
-    new_icons = await asyncio.gather(*async_icon_fetch_tasks)
+    # Image and icon fetches are independent, so run them in one gather
+    # instead of waiting for all images before starting the icons
+    fetch_results = await asyncio.gather(
+        *async_image_fetch_tasks, *async_icon_fetch_tasks
+    )
+    new_images = fetch_results[: len(async_image_fetch_tasks)]
+    new_icons = fetch_results[len(async_image_fetch_tasks) :]
 
     # list of new assets
     new_assets = []
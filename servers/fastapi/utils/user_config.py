@@ -58,17 +58,43 @@ from utils.set_env import (
 )
 
 
-def get_user_config():
-    user_config_path = get_user_config_path_env()
+# Parsed config file cached by (path, mtime); the env update middleware
+# calls get_user_config on every request, so skip re-reading and
+# re-parsing the file until it actually changes
+_user_config_file_cache = None
+
+
+def _load_user_config_file(user_config_path):
+    global _user_config_file_cache
+
+    if not user_config_path:
+        return UserConfig()
+
+    try:
+        mtime = os.path.getmtime(user_config_path)
+    except OSError:
+        return UserConfig()
+
+    if _user_config_file_cache is not None:
+        cached_path, cached_mtime, cached_config = _user_config_file_cache
+        if cached_path == user_config_path and cached_mtime == mtime:
+            return cached_config
 
-    existing_config = UserConfig()
     try:
-        if os.path.exists(user_config_path):
-            with open(user_config_path, "r") as f:
-                existing_config = UserConfig(**json.load(f))
+        with open(user_config_path, "r") as f:
+            existing_config = UserConfig(**json.load(f))
     except Exception:
         print("Error while loading user config")
-        pass
+        return UserConfig()
+
+    _user_config_file_cache = (user_config_path, mtime, existing_config)
+    return existing_config
+
+
+def get_user_config():
+    user_config_path = get_user_config_path_env()
+
+    existing_config = _load_user_config_file(user_config_path)
 
     return UserConfig(
         LLM=existing_config.LLM or get_llm_provider_env(),